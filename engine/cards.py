@@ -15,6 +15,11 @@ class Suit(Enum):
     SPADES = "♠"
 
 
+# Stable 0-3 index per suit for array/bitmask representations (Suit values
+# are display glyphs, not integers)
+SUIT_INDEX = {suit: i for i, suit in enumerate(Suit)}
+
+
 class Rank(Enum):
     TWO = 2
     THREE = 3
@@ -36,6 +41,12 @@ class Card:
     rank: Rank
     suit: Suit
 
+    def __post_init__(self):
+        # Cached integer views for hot paths: readers get a plain attribute
+        # load instead of walking rank.value / SUIT_INDEX[suit] per access
+        self.rank_value = self.rank.value
+        self.suit_index = SUIT_INDEX[self.suit]
+
     def __str__(self) -> str:
         rank_str = {
             Rank.TWO: "2", Rank.THREE: "3", Rank.FOUR: "4", Rank.FIVE: "5",
@@ -163,18 +174,78 @@ class HandEvaluator:
     @staticmethod
     def _is_straight(ranks: List[int]) -> bool:
         """Check if ranks form a straight"""
-        # Handle ace-low straight (A-2-3-4-5)
-        if sorted(ranks) == [2, 3, 4, 5, 14]:
-            return True
-        
-        unique_ranks = sorted(list(set(ranks)), reverse=True)
-        if len(unique_ranks) < 5:
-            return False
+        # Fold the ranks into a bitmask; _mask_has_straight scans it for 5
+        # consecutive bits and already treats the ace as low for A-2-3-4-5.
+        # Duplicated ranks collapse onto the same bit, so fewer than 5
+        # distinct ranks can never produce a straight.
+        mask = 0
+        for rank in ranks:
+            mask |= 1 << rank
+        return HandEvaluator._mask_has_straight(mask)
+
+    @staticmethod
+    def _mask_has_straight(rank_mask: int) -> bool:
+        """Check a rank bitmask for 5 consecutive ranks (ace counts low too)"""
+        m = rank_mask | ((rank_mask >> 14) & 1) << 1
+        return (m & (m >> 1) & (m >> 2) & (m >> 3) & (m >> 4)) != 0
+
+    @staticmethod
+    def classify_best_hand(all_cards: List[Card]) -> str:
+        """
+        Determine the best hand type achievable from a list of cards without
+        enumerating 5-card combinations.
+        Uses rank counts and per-suit rank bitmasks, so it runs in a single
+        pass over the cards. Returns only the hand type; use
+        evaluate_best_hand when tie_breakers or the best 5 cards are needed.
+        """
+        if len(all_cards) < 5:
+            raise ValueError("Must have at least 5 cards to evaluate.")
 
-        for i in range(len(unique_ranks) - 4):
-            if unique_ranks[i] - unique_ranks[i+4] == 4:
-                return True
-        return False
+        ranks = [card.rank_value for card in all_cards]
+        suit_indices = [card.suit_index for card in all_cards]
+        return HandEvaluator.classify_from_arrays(ranks, suit_indices)
+
+    @staticmethod
+    def classify_from_arrays(ranks: List[int], suit_indices: List[int]) -> str:
+        """
+        Array-based variant of classify_best_hand for callers that already
+        hold the cards as parallel rank/suit-index integer lists (avoids
+        re-reading Card attributes in hot loops).
+        """
+        rank_counts = {}
+        suit_masks = [0, 0, 0, 0]
+        all_ranks = 0
+        for i in range(len(ranks)):
+            rank = ranks[i]
+            rank_counts[rank] = rank_counts.get(rank, 0) + 1
+            bit = 1 << rank
+            suit_masks[suit_indices[i]] |= bit
+            all_ranks |= bit
+
+        # Straight/royal flush: look for 5 in sequence within a single suit
+        royal_bits = 0b11111 << 10  # 10-J-Q-K-A
+        for mask in suit_masks:
+            if HandEvaluator._mask_has_straight(mask):
+                if mask & royal_bits == royal_bits:
+                    return 'royal_flush'
+                return 'straight_flush'
+
+        counts = sorted(rank_counts.values(), reverse=True)
+        if counts[0] == 4:
+            return 'four_of_a_kind'
+        if counts[0] == 3 and counts[1] >= 2:
+            return 'full_house'
+        if any(bin(mask).count("1") >= 5 for mask in suit_masks):
+            return 'flush'
+        if HandEvaluator._mask_has_straight(all_ranks):
+            return 'straight'
+        if counts[0] == 3:
+            return 'three_of_a_kind'
+        if counts[0] == 2:
+            if counts[1] == 2:
+                return 'two_pair'
+            return 'pair'
+        return 'high_card'
 
     @staticmethod
     def evaluate_best_hand(all_cards: List[Card]) -> Tuple[str, List[int], List[Card]]:
@@ -6,24 +6,162 @@ This bot uses a simple but effective strategy:
 - Postflop: Use the hand evaluator to play strong made hands aggressively, call reasonable bets with top pair,
   and semi-bluff strong draws. Uses pot-based sizing and respects legal actions.
 """
-from typing import List, Dict, Any
+from typing import Dict, List, Tuple, Any
 
 from bot_api import PokerBotAPI, PlayerAction, GameInfoAPI
 from engine.cards import Card, Rank, HandEvaluator
 from engine.poker_game import GameState
 
+try:
+	from numba import njit  # optional: compiles the draw kernel for sim-heavy runs
+except ImportError:
+	njit = None
+
+
+def _draw_kernel(ranks: List[int], suits: List[int]) -> bool:
+	"""Bitmask draw detection over parallel rank/suit integer sequences.
+
+	Pure integer ops only (popcount via Kernighan's loop) so numba can
+	compile it unchanged; without numba it runs as-is under the interpreter.
+	"""
+	suit_masks = [0, 0, 0, 0]
+	all_ranks = 0
+	for i in range(len(ranks)):
+		bit = 1 << ranks[i]
+		suit_masks[suits[i]] |= bit
+		all_ranks |= bit
+
+	# Flush draw: 4 to a suit
+	for mask in suit_masks:
+		count = 0
+		while mask:
+			mask &= mask - 1
+			count += 1
+		if count >= 4:
+			return True
+
+	# Straight draw approximation: four consecutive ranks anywhere, with
+	# the ace bit duplicated low so A-2-3-4 counts as a sequence.
+	r = all_ranks | ((all_ranks >> 14) & 1) << 1
+	return (r & (r >> 1) & (r >> 2) & (r >> 3)) != 0
+
+
+if njit is not None:
+	_draw_kernel = njit(cache=True)(_draw_kernel)
+
+# Hand-ranking thresholds used on every postflop decision, resolved once.
+_RANK_PAIR = HandEvaluator.HAND_RANKINGS.get('pair', 1)
+_RANK_TWO_PAIR = HandEvaluator.HAND_RANKINGS.get('two_pair', 2)
+
+# Bit per legal action: membership tests become a single AND against the
+# mask built once per decision, instead of list scans with enum equality.
+_CHECK_BIT = 1 << PlayerAction.CHECK.value
+_CALL_BIT = 1 << PlayerAction.CALL.value
+_RAISE_BIT = 1 << PlayerAction.RAISE.value
+
+# The enum members themselves, pre-resolved so the decision kernel loads a
+# single global instead of walking PlayerAction.<member> each time.
+_FOLD = PlayerAction.FOLD
+_CHECK = PlayerAction.CHECK
+_CALL = PlayerAction.CALL
+_RAISE = PlayerAction.RAISE
+
+
+def _preflop_score(r1: int, r2: int, suited: bool) -> float:
+	"""Score one preflop hand: pocket pairs, high cards, suitedness, connectedness.
+
+	All bonuses are expressed as bool-times-weight products so the formula is
+	branchless; the conditions are mutually exclusive where it matters."""
+	hi = max(r1, r2)
+	high_card_bonus = (hi >= Rank.KING.value) * 0.18 + (hi == Rank.ACE.value) * 0.12
+	pair_bonus = (r1 == r2) * 0.3
+	distance = abs(r1 - r2)
+	connector_bonus = (distance <= 1) * 0.15 + (distance == 2) * 0.08
+	suited_bonus = suited * 0.12
+	base = (r1 + r2) / (2.0 * Rank.ACE.value)
+	score = base * 0.4 + pair_bonus + connector_bonus + suited_bonus + high_card_bonus
+	return score if score < 1.0 else 1.0
+
+
+# There are only 169 strategically distinct preflop hands (13x13 rank pairs x
+# suited/offsuit), so precompute them all once and reduce per-call evaluation
+# to a single dict lookup. Keys are (low_rank, high_rank, suited).
+_PREFLOP_TABLE: Dict[Tuple[int, int, bool], float] = {
+	(r1, r2, suited): _preflop_score(r1, r2, suited)
+	for r1 in range(2, 15)
+	for r2 in range(r1, 15)
+	for suited in (False, True)
+}
+
+
+def batch_evaluate_preflop(holes):
+	"""Vectorized preflop scoring for offline tuning and simulation sweeps.
+
+	holes is an (N, 2, 2) integer array of (rank, suit) per hole card.
+	Returns an (N,) float array of confidences matching
+	NATHANBot._evaluate_preflop_strength applied row-wise, computed as a
+	single NumPy kernel instead of N Python calls.
+
+	NumPy is imported lazily so live play keeps its standard-library-only
+	footprint; only tuner scripts need it installed.
+	"""
+	import numpy as np
+
+	r1 = holes[:, 0, 0]
+	r2 = holes[:, 1, 0]
+	hi = np.maximum(r1, r2)
+	pair_bonus = (r1 == r2) * 0.3
+	distance = np.abs(r1 - r2)
+	connector_bonus = np.where(distance <= 1, 0.15, np.where(distance == 2, 0.08, 0.0))
+	suited_bonus = (holes[:, 0, 1] == holes[:, 1, 1]) * 0.12
+	high_card_bonus = (hi >= Rank.KING.value) * 0.18 + (hi == Rank.ACE.value) * 0.12
+	base = (r1 + r2) / (2.0 * Rank.ACE.value)
+	score = base * 0.4 + pair_bonus + connector_bonus + suited_bonus + high_card_bonus
+	return np.minimum(score, 1.0)
+
 
 class NATHANBot(PokerBotAPI):
+	# Class-level default so _set_aggression's no-change check has something
+	# to compare against on the very first call from __init__
+	aggression = None
+
 	def __init__(self, name: str):
 		super().__init__(name)
 		self.hands_played = 0
 		self.hands_won = 0
-		self.aggression = 0.6  # tuning parameter for raises
+		self._set_aggression(0.6)  # tuning parameter for raises
 		self.last_raised_preflop = False
 		self.min_confidence_to_raise = 0.75
 		self.min_confidence_to_play = 0.45
-		self.opponent_stats: Dict[str, Dict[str, int]] = {}
+		# Opponent counters as parallel lists indexed via _opp_index; pre-sized
+		# at tournament_start and grown lazily for opponents seen before then
+		self._opp_index: Dict[str, int] = {}
+		self._opp_seen: List[int] = []
+		self._opp_raised: List[int] = []
+		self._opp_won: List[int] = []
 		self.chip_percentage_history: List[float] = []  # Track chip percentage over time
+		# Last postflop evaluation, keyed by the exact cards seen; reused when
+		# the board has not changed since the previous call
+		self._eval_cache_key = None
+		self._eval_cache = None
+
+	def _set_aggression(self, value: float):
+		"""Set aggression and refresh the precomputed raise-sizing factors.
+
+		Every _choose_raise_amount call site passes a constant factor, so the
+		factor * aggression products are materialized here, once per
+		aggression change, instead of being multiplied on every raise.
+
+		get_action re-asserts the aggression tier on every decision, so the
+		common no-change case returns after a single compare."""
+		if value == self.aggression:
+			return
+		self.aggression = value
+		self._f06 = 0.6 * value   # continuation bets / semi-bluffs
+		self._f10 = 1 * value     # value raises
+		self._f15 = 1.5 * value   # small late-position opens
+		self._f20 = 2.0 * value   # standard preflop raises
+		self._f25 = 2.5 * value   # late-position preflop raises
 
 	def get_action(self, game_state: GameState, hole_cards: List[Card], 
 				   legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> tuple:
@@ -38,33 +176,39 @@ class NATHANBot(PokerBotAPI):
 		
 		# Adjust aggression based on chip percentage
 		if chip_percentage > high_threshold:  # High share of chips
-			self.aggression = 0.9  # Increase aggression for high chip share
+			self._set_aggression(0.9)  # Increase aggression for high chip share
 		elif chip_percentage < low_threshold:  # Low share of chips
-			self.aggression = 0.3  # Decrease aggression for low chip share
+			self._set_aggression(0.3)  # Decrease aggression for low chip share
 		else:  # Moderate share of chips
-			self.aggression = 0.6
+			self._set_aggression(0.6)
 
 		# Defensive: if no legal actions, fold
 		if not legal_actions:
-			return PlayerAction.FOLD, 0
+			return _FOLD, 0
+
+		# One bit per legal action; every membership test below is a single
+		# AND against this mask instead of a list scan
+		legal_mask = 0
+		for a in legal_actions:
+			legal_mask |= 1 << a.value
 
 		# Preflop vs postflop branching
 		if game_state.round_name == "preflop":
-			action = self._preflop(game_state, hole_cards, legal_actions, min_bet, max_bet)
+			action = self._preflop(game_state, hole_cards, legal_mask, min_bet, max_bet)
 			# remember if we raised preflop to use as a continuation-bet signal
-			if action[0] == PlayerAction.RAISE:
+			if action[0] == _RAISE:
 				self.last_raised_preflop = True
 			else:
 				self.last_raised_preflop = False
 			return action
 		else:
-			return self._postflop(game_state, hole_cards, legal_actions, min_bet, max_bet)
+			return self._postflop(game_state, hole_cards, legal_mask, min_bet, max_bet)
 
-	def _preflop(self, game_state: GameState, hole_cards: List[Card], legal_actions: List[PlayerAction],
+	def _preflop(self, game_state: GameState, hole_cards: List[Card], legal_mask: int,
 				 min_bet: int, max_bet: int) -> tuple:
 		# Basic sanity
 		if len(hole_cards) != 2:
-			return PlayerAction.FOLD, 0
+			return _FOLD, 0
 
 		# Evaluate preflop hand strength as a normalized confidence (0..1)
 		confidence = self._evaluate_preflop_strength(hole_cards)
@@ -76,140 +220,155 @@ class NATHANBot(PokerBotAPI):
 
 		# Strong hands: raise aggressively
 		if confidence >= self.min_confidence_to_raise:
-			if PlayerAction.RAISE in legal_actions:
-				amount = self._choose_raise_amount(game_state, min_bet, max_bet, factor=2.5 if late else 2.0)
-				return PlayerAction.RAISE, amount
-			if PlayerAction.CALL in legal_actions and to_call <= game_state.big_blind * 2:
-				return PlayerAction.CALL, 0
+			if legal_mask & _RAISE_BIT:
+				amount = self._choose_raise_amount(game_state, min_bet, max_bet, self._f25 if late else self._f20)
+				return _RAISE, amount
+			if legal_mask & _CALL_BIT and to_call <= game_state.big_blind * 2:
+				return _CALL, 0
 
 		# Medium strength: play in late position or call small bets
 		if confidence >= self.min_confidence_to_play:
 			if to_call == 0:
 				# If it's a free option, limp/check
-				if PlayerAction.CHECK in legal_actions:
-					return PlayerAction.CHECK, 0
+				if legal_mask & _CHECK_BIT:
+					return _CHECK, 0
 				# otherwise raise small in late position
-				if late and PlayerAction.RAISE in legal_actions:
-					return PlayerAction.RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, factor=1.5)
+				if late and legal_mask & _RAISE_BIT:
+					return _RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, self._f15)
 			else:
 				# Facing a bet - call only if pot odds reasonable
 				pot_odds = GameInfoAPI.get_pot_odds(game_state.pot, to_call)
-				if pot_odds >= 2.5 and PlayerAction.CALL in legal_actions:
-					return PlayerAction.CALL, 0
+				if pot_odds >= 2.5 and legal_mask & _CALL_BIT:
+					return _CALL, 0
 
 		# Otherwise fold or check
-		if PlayerAction.CHECK in legal_actions:
-			return PlayerAction.CHECK, 0
-		return PlayerAction.FOLD, 0
+		if legal_mask & _CHECK_BIT:
+			return _CHECK, 0
+		return _FOLD, 0
 
 	def _evaluate_preflop_strength(self, hole_cards: List[Card]) -> float:
 		"""Return a confidence 0.0..1.0 for preflop hand strength.
-		Simple heuristic: pocket pairs, high-card combos, suitedness, connectedness."""
+		Single lookup into the precomputed 169-hand table."""
 		c1, c2 = hole_cards
-		r1, r2 = c1.rank.value, c2.rank.value
-		suited = c1.suit == c2.suit
-		high_card_bonus = (max(r1, r2) >= Rank.KING.value) * 0.18 + (max(r1, r2) == Rank.ACE.value) * 0.12
-		pair_bonus = 0.3 if r1 == r2 else 0.0
-		distance = abs(r1 - r2)
-		connector_bonus = 0.15 if distance <= 1 else (0.08 if distance == 2 else 0.0)
-		suited_bonus = 0.12 if suited else 0.0
-		base = (r1 + r2) / (2.0 * Rank.ACE.value)
-		score = base * 0.4 + pair_bonus + connector_bonus + suited_bonus + high_card_bonus
-		return min(1.0, score)
-
-	def _postflop(self, game_state: GameState, hole_cards: List[Card], legal_actions: List[PlayerAction],
+		r1, r2 = c1.rank_value, c2.rank_value
+		if r1 > r2:
+			r1, r2 = r2, r1
+		return _PREFLOP_TABLE[(r1, r2, c1.suit == c2.suit)]
+
+	def _postflop(self, game_state: GameState, hole_cards: List[Card], legal_mask: int,
 				  min_bet: int, max_bet: int) -> tuple:
-		# Evaluate current hand strength
-		all_cards = hole_cards + game_state.community_cards
-		hand_type, _, best5 = HandEvaluator.evaluate_best_hand(all_cards)
-		rank_value = HandEvaluator.HAND_RANKINGS[hand_type]
+		# Cheap legal-action filter before any evaluation: with neither raise
+		# nor call available, every strength tier below collapses to the same
+		# check-or-fold fallback, so hand strength cannot affect the outcome.
+		if not legal_mask & (_RAISE_BIT | _CALL_BIT):
+			if legal_mask & _CHECK_BIT:
+				return _CHECK, 0
+			return _FOLD, 0
+
+		# Decompose cards into parallel integer arrays once (structure-of-
+		# arrays); the classifier and draw kernel both consume these, so the
+		# Card attribute chains are walked a single time per decision.
+		ranks = [c.rank_value for c in hole_cards]
+		suits = [c.suit_index for c in hole_cards]
+		for c in game_state.community_cards:
+			ranks.append(c.rank_value)
+			suits.append(c.suit_index)
+
+		# Evaluate current hand strength. Only the hand category matters for
+		# the decisions below, so use the single-pass classifier instead of
+		# the 7-choose-5 evaluate_best_hand scan. The cards only change
+		# between streets but _postflop may run several times per street
+		# (re-raises), so reuse the previous evaluation when they match.
+		cache_key = (tuple(ranks), tuple(suits))
+		if cache_key == self._eval_cache_key:
+			rank_value, has_draw = self._eval_cache
+		else:
+			rank_value = HandEvaluator.HAND_RANKINGS[HandEvaluator.classify_from_arrays(ranks, suits)]
+			has_draw = _draw_kernel(ranks, suits)
+			self._eval_cache_key = cache_key
+			self._eval_cache = (rank_value, has_draw)
+
+		# Hoist the game-state fields the branches below share into locals;
+		# to_call is the same for every branch, compute it once
+		pot = game_state.pot
+		current_bet = game_state.current_bet
+		to_call = GameInfoAPI.calculate_bet_amount(current_bet, game_state.player_bets.get(self.name, 0))
 
 		# Quick helpers for legal action fallbacks
 		def fallback_check_call_fold():
-			if PlayerAction.CHECK in legal_actions:
-				return PlayerAction.CHECK, 0
-			if PlayerAction.CALL in legal_actions:
-				return PlayerAction.CALL, 0
-			return PlayerAction.FOLD, 0
+			if legal_mask & _CHECK_BIT:
+				return _CHECK, 0
+			if legal_mask & _CALL_BIT:
+				return _CALL, 0
+			return _FOLD, 0
 
 		# If we raised preflop and nobody has bet yet, consider a continuation bet
-		if self.last_raised_preflop and game_state.current_bet == 0 and PlayerAction.RAISE in legal_actions:
+		if self.last_raised_preflop and current_bet == 0 and legal_mask & _RAISE_BIT:
 			# only c-bet with at least a pair or a strong draw
-			if rank_value >= HandEvaluator.HAND_RANKINGS.get('pair', 1) or self._has_strong_draw(all_cards):
-				return PlayerAction.RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, factor=0.6)
+			if rank_value >= _RANK_PAIR or has_draw:
+				return _RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, self._f06)
 
 		# Strong made hands (two pair or better): be aggressive
-		if rank_value >= HandEvaluator.HAND_RANKINGS.get('two_pair', 2):
-			if PlayerAction.RAISE in legal_actions:
-				return PlayerAction.RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, factor=1)
+		if rank_value >= _RANK_TWO_PAIR:
+			if legal_mask & _RAISE_BIT:
+				return _RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, self._f10)
 			return fallback_check_call_fold()
 
 		# Top pair / pair: defend reasonably
-		if rank_value >= HandEvaluator.HAND_RANKINGS.get('pair', 1):
+		if rank_value >= _RANK_PAIR:
 			# If pot is large relative to bet, call; if we can raise to protect, do so sometimes
-			pot = game_state.pot
-			if PlayerAction.CALL in legal_actions:
-				to_call = GameInfoAPI.calculate_bet_amount(game_state.current_bet, game_state.player_bets[self.name])
+			if legal_mask & _CALL_BIT:
 				pot_odds = GameInfoAPI.get_pot_odds(pot, to_call)
 				if pot_odds >= 1.5 or to_call == 0:
 					# Good odds or free, call
 					# Occasionally raise to extract value
-					if PlayerAction.RAISE in legal_actions and self._should_bluff_or_value(pot, rank_value):
-						return PlayerAction.RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, factor=1)
-					return PlayerAction.CALL, 0
+					if legal_mask & _RAISE_BIT and self._should_bluff_or_value(pot, rank_value):
+						return _RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, self._f10)
+					return _CALL, 0
 			return fallback_check_call_fold()
 
 		# Drawing hands: semi-bluff if good draw; otherwise respect pot odds
-		if self._has_strong_draw(all_cards):
-			to_call = GameInfoAPI.calculate_bet_amount(game_state.current_bet, game_state.player_bets.get(self.name, 0))
-			pot_odds = GameInfoAPI.get_pot_odds(game_state.pot, to_call)
+		if has_draw:
+			pot_odds = GameInfoAPI.get_pot_odds(pot, to_call)
 			# If free or good odds, call; if we can apply pressure, semi-bluff
-			if to_call == 0 and PlayerAction.RAISE in legal_actions:
-				return PlayerAction.RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, factor=0.6)
+			if to_call == 0 and legal_mask & _RAISE_BIT:
+				return _RAISE, self._choose_raise_amount(game_state, min_bet, max_bet, self._f06)
 			# require ~3:1 or better for draws
-			if pot_odds >= 3.0 and PlayerAction.CALL in legal_actions:
-				return PlayerAction.CALL, 0
+			if pot_odds >= 3.0 and legal_mask & _CALL_BIT:
+				return _CALL, 0
 			# else fold or check
 			return fallback_check_call_fold()
 
 		# Nothing: check or fold
 		return fallback_check_call_fold()
 
-	def _choose_raise_amount(self, game_state: GameState, min_bet: int, max_bet: int, factor: float = 1.0) -> int:
-		"""Choose a sensible raise amount: factor * pot, clamped to [min_bet, max_bet].
-		The game expects the total bet amount (not additional)."""
-		# Adjust raise factor based on aggression level
-		adjusted_factor = factor * self.aggression
-		desired = int(game_state.pot * adjusted_factor)
-		amount = max(min_bet, desired)
-		amount = min(amount, max_bet)
+	def _choose_raise_amount(self, game_state: GameState, min_bet: int, max_bet: int, adjusted_factor: float) -> int:
+		"""Choose a sensible raise amount: adjusted_factor * pot, clamped to
+		[min_bet, max_bet]. adjusted_factor is one of the aggression-scaled
+		products maintained by _set_aggression; the game expects the total
+		bet amount (not additional)."""
+		# Clamp with inline comparisons rather than the builtin min/max calls.
+		amount = int(game_state.pot * adjusted_factor)
+		if amount < min_bet:
+			amount = min_bet
+		if amount > max_bet:
+			amount = max_bet
 		if amount < min_bet:
 			return min_bet
 		return amount
 
 	def _has_strong_draw(self, all_cards: List[Card]) -> bool:
-		# Flush draw: 4 to a suit
-		suits = [c.suit for c in all_cards]
-		for s in set(suits):
-			if suits.count(s) >= 4:
-				return True
-
-		# Open-ended straight draw approximation: check if there are 4 cards in sequence window
-		ranks = sorted(set(c.rank.value for c in all_cards))
-		if len(ranks) >= 4:
-			for i in range(len(ranks) - 3):
-				if ranks[i+3] - ranks[i] == 3:
-					return True
-		# Ace-low considerations
-		if set([14, 2, 3, 4]).issubset(ranks) or set([2, 3, 4, 5]).issubset(ranks):
-			return True
-
-		return False
+		# Decompose cards into parallel integer sequences, then hand off to
+		# the (optionally numba-compiled) bitmask kernel. _postflop builds
+		# the arrays itself and calls the kernel directly.
+		ranks = [c.rank_value for c in all_cards]
+		suits = [c.suit_index for c in all_cards]
+		return _draw_kernel(ranks, suits)
 
 	def _should_bluff_or_value(self, pot: int, rank_value: int) -> bool:
 		# Decide whether to raise for value or as bluff/semi-bluff.
 		# Use simple heuristics: higher aggression when pot is larger or we have stronger hands.
-		if rank_value >= HandEvaluator.HAND_RANKINGS.get('pair', 1):
+		if rank_value >= _RANK_PAIR:
 			return True if (pot > 2 * max(1, self.aggression * 10)) else False
 		# otherwise use aggression multiplier
 		return True if self.aggression > 0.6 else False
@@ -226,29 +385,51 @@ class NATHANBot(PokerBotAPI):
 		if 'winners' in hand_result and self.name in hand_result['winners']:
 			self.hands_won += 1
 			# Slightly increase aggression on wins
-			self.aggression = min(0.8, self.aggression + 0.01)
+			raised = self.aggression + 0.01
+			self._set_aggression(raised if raised < 0.8 else 0.8)
 		else:
 			# Slightly reduce aggression on losses
-			self.aggression = max(0.3, self.aggression - 0.005)
-
-		# Update simple opponent stats based on final bets seen
-		try:
-			for player, bet in game_state.player_bets.items():
-				if player == self.name:
-					continue
-				stats = self.opponent_stats.setdefault(player, {'seen': 0, 'raised': 0, 'won': 0})
-				stats['seen'] += 1
-				if bet > game_state.big_blind * 2:
-					stats['raised'] += 1
-				if 'winners' in hand_result and player in hand_result['winners']:
-					stats['won'] += 1
-		except Exception:
-			pass
+			lowered = self.aggression - 0.005
+			self._set_aggression(lowered if lowered > 0.3 else 0.3)
+
+		# Update simple opponent stats based on final bets seen. Alias the
+		# counter lists and loop-invariant values into locals once so the
+		# per-opponent loop body touches no attributes.
+		winners = hand_result.get('winners', ())
+		raise_threshold = game_state.big_blind * 2
+		my_name = self.name
+		opp_index = self._opp_index
+		seen = self._opp_seen
+		raised_counts = self._opp_raised
+		won_counts = self._opp_won
+		for player, bet in game_state.player_bets.items():
+			if player == my_name:
+				continue
+			idx = opp_index.get(player)
+			if idx is None:
+				idx = len(seen)
+				opp_index[player] = idx
+				seen.append(0)
+				raised_counts.append(0)
+				won_counts.append(0)
+			seen[idx] += 1
+			if bet > raise_threshold:
+				raised_counts[idx] += 1
+			if player in winners:
+				won_counts[idx] += 1
 
 		# Update chip percentage history
 		chip_percentage = self._calculate_chip_percentage(game_state)
 		self.chip_percentage_history.append(chip_percentage)
 
+	@property
+	def opponent_stats(self) -> Dict[str, Dict[str, int]]:
+		"""Dict view of the per-opponent counters (kept for compatibility)."""
+		return {
+			player: {'seen': self._opp_seen[i], 'raised': self._opp_raised[i], 'won': self._opp_won[i]}
+			for player, i in self._opp_index.items()
+		}
+
 	def get_chip_percentage_history(self) -> List[float]:
 		"""Retrieve the history of chip percentages."""
 		return self.chip_percentage_history
@@ -258,11 +439,17 @@ class NATHANBot(PokerBotAPI):
 		# Reset counters
 		self.hands_played = 0
 		self.hands_won = 0
+		# Pre-size the opponent counters now that the field is known
+		opponents = [p for p in players if p != self.name]
+		self._opp_index = {p: i for i, p in enumerate(opponents)}
+		self._opp_seen = [0] * len(opponents)
+		self._opp_raised = [0] * len(opponents)
+		self._opp_won = [0] * len(opponents)
 		# Adjust base aggression by table size
 		if len(players) <= 4:
-			self.aggression = 0.65
+			self._set_aggression(0.65)
 		elif len(players) >= 8:
-			self.aggression = 0.45
+			self._set_aggression(0.45)
 		else:
-			self.aggression = 0.55
+			self._set_aggression(0.55)
 
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Profile NATHANBot's decision kernel over randomized game states.
+
+Drives get_action through a large number of synthetic preflop and
+postflop decisions under cProfile and prints the hottest functions.
+Use this to see where decision time actually goes before (and after)
+touching the hot path.
+"""
+import argparse
+import cProfile
+import pstats
+import random
+
+from engine.cards import Card, Rank, Suit
+from engine.poker_game import GameState, PlayerAction
+from players.NATHAN_bot import NATHANBot
+
+
+def run_decisions(bot: NATHANBot, iterations: int, seed: int):
+    rng = random.Random(seed)
+    deck = [Card(rank, suit) for rank in Rank for suit in Suit]
+    legal = [PlayerAction.FOLD, PlayerAction.CHECK, PlayerAction.CALL, PlayerAction.RAISE]
+
+    for _ in range(iterations):
+        rng.shuffle(deck)
+        hole_cards = deck[:2]
+        community = deck[2:2 + rng.choice([0, 3, 4, 5])]
+        round_name = "preflop" if not community else "flop"
+        game_state = GameState(
+            pot=rng.randint(30, 600),
+            community_cards=community,
+            current_bet=rng.choice([0, 20, 60, 120]),
+            player_chips={"nathan": 1000, "opp1": 1000, "opp2": 1000},
+            player_bets={"nathan": rng.choice([0, 20]), "opp1": 20, "opp2": 20},
+            active_players=["nathan", "opp1", "opp2"],
+            current_player="nathan",
+            round_name=round_name,
+            min_bet=20,
+            min_raise=20,
+            big_blind=20,
+            small_blind=10
+        )
+        bot.get_action(game_state, hole_cards, legal, 20, 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile NATHANBot decisions")
+    parser.add_argument("-n", "--iterations", type=int, default=100000,
+                        help="Number of decisions to simulate (default: 100000)")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    parser.add_argument("--top", type=int, default=25,
+                        help="Number of profile rows to print (default: 25)")
+    args = parser.parse_args()
+
+    bot = NATHANBot("nathan")
+    bot.tournament_start(["nathan", "opp1", "opp2"], 1000)
+
+    print(f"Profiling {args.iterations:,} decisions...")
+    profiler = cProfile.Profile()
+    profiler.enable()
+    run_decisions(bot, args.iterations, args.seed)
+    profiler.disable()
+
+    stats = pstats.Stats(profiler)
+    stats.sort_stats("cumulative").print_stats(args.top)
+
+
+if __name__ == "__main__":
+    main()
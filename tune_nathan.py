@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Offline Monte Carlo tuner for NATHANBot's strategy parameters.
+
+Samples a large batch of random hole cards, scores them in one shot with
+batch_evaluate_preflop, and sweeps grids of min_confidence_to_play /
+min_confidence_to_raise (reporting the play and raise frequencies each
+pair produces) plus aggression (reporting the opening sizes it implies).
+The combination closest to the requested target frequencies is printed
+as the recommendation.
+
+Requires NumPy (the only script in this project that does); live play
+remains standard-library-only.
+"""
+import argparse
+
+from players.NATHAN_bot import batch_evaluate_preflop
+
+
+def sample_holes(rng, num_hands):
+    """Sample (num_hands, 2, 2) hole cards as (rank, suit) ints, two distinct cards per hand."""
+    import numpy as np
+
+    # Draw two distinct cards from 0..51, then split into rank (2..14) and suit (0..3)
+    first = rng.integers(0, 52, size=num_hands)
+    second = rng.integers(0, 51, size=num_hands)
+    second = second + (second >= first)  # shift to skip the first card
+    holes = np.empty((num_hands, 2, 2), dtype=np.int64)
+    for slot, cards in enumerate((first, second)):
+        holes[:, slot, 0] = cards // 4 + 2   # rank
+        holes[:, slot, 1] = cards % 4        # suit
+    return holes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune NATHANBot thresholds via Monte Carlo")
+    parser.add_argument("-n", "--hands", type=int, default=1_000_000,
+                        help="Number of hole-card samples (default: 1,000,000)")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    parser.add_argument("--target-play", type=float, default=0.25,
+                        help="Target fraction of hands played (default: 0.25)")
+    parser.add_argument("--target-raise", type=float, default=0.12,
+                        help="Target fraction of hands open-raised (default: 0.12)")
+    args = parser.parse_args()
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise SystemExit("tune_nathan.py requires NumPy: pip install numpy")
+
+    rng = np.random.default_rng(args.seed)
+    print(f"Scoring {args.hands:,} random hole cards...")
+    confidences = batch_evaluate_preflop(sample_holes(rng, args.hands))
+
+    play_grid = np.arange(0.30, 0.61, 0.05)
+    raise_grid = np.arange(0.60, 0.91, 0.05)
+
+    print("\nPlay/raise frequency by threshold pair:")
+    print(f"{'play_thr':>9} {'raise_thr':>10} {'play%':>7} {'raise%':>7}")
+    best = None
+    for play_thr in play_grid:
+        play_rate = float(np.mean(confidences >= play_thr))
+        for raise_thr in raise_grid:
+            if raise_thr <= play_thr:
+                continue
+            raise_rate = float(np.mean(confidences >= raise_thr))
+            print(f"{play_thr:9.2f} {raise_thr:10.2f} {play_rate * 100:6.1f}% {raise_rate * 100:6.1f}%")
+            # Distance from the requested playing style
+            error = abs(play_rate - args.target_play) + abs(raise_rate - args.target_raise)
+            if best is None or error < best[0]:
+                best = (error, play_thr, raise_thr, play_rate, raise_rate)
+
+    _, play_thr, raise_thr, play_rate, raise_rate = best
+    print(f"\nRecommended: min_confidence_to_play={play_thr:.2f} "
+          f"(plays {play_rate * 100:.1f}%), min_confidence_to_raise={raise_thr:.2f} "
+          f"(raises {raise_rate * 100:.1f}%)")
+
+    # Aggression only scales raise sizing (factor * aggression * pot); show the
+    # preflop open size each setting implies for a typical unopened pot.
+    big_blind = 20
+    pot = 30  # blinds only
+    print("\nImplied preflop open size (big blinds) by aggression:")
+    for aggression in np.arange(0.3, 0.91, 0.1):
+        open_size = max(big_blind, int(pot * 2.0 * aggression)) / big_blind
+        print(f"  aggression={aggression:.1f}: {open_size:.1f}bb")
+
+
+if __name__ == "__main__":
+    main()